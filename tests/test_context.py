@@ -5477,6 +5477,31 @@ class ContextTest(TestCase):
             '`xx` is not a supported language.'
         )
 
+    def test_update_queryset_partial_fields(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = Continent.objects.all()
+        with Context(continents) as context:
+            europe = [x for x in continents if x.code == 'EU'][0]
+            asia = [x for x in continents if x.code == 'AS'][0]
+
+            europe.name = 'Europe Name'
+
+            context.update('de')
+
+            context.reset()
+
+            context.read('de')
+
+        self.assertEqual(europe.name, 'Europe Name')
+        self.assertEqual(europe.denonym, 'Europäisch')
+        self.assertEqual(asia.name, 'Asien')
+        self.assertEqual(asia.denonym, 'Asiatisch')
+
     @override(language='de', deactivate=True)
     def test_delete_instance_level_0_relation_no_lang(self):
         create_samples(
@@ -8,7 +8,8 @@ from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.models import User
 
 from translations.management.commands.synctranslations import Command
-from translations.models import Translation
+from translations.models import Translation, _translatable_fields, \
+    _translatable_fields_names
 
 from sample.models import Continent, Country, City
 from sample.utils import create_samples
@@ -53,18 +54,14 @@ class override_tmeta(ContextDecorator):
 
         setattr(self.model, 'TranslatableMeta', new_tmeta)
 
-        if hasattr(self.model, '_cached_translatable_fields'):
-            delattr(self.model, '_cached_translatable_fields')
-        if hasattr(self.model, '_cached_translatable_fields_names'):
-            delattr(self.model, '_cached_translatable_fields_names')
+        _translatable_fields.pop(self.model, None)
+        _translatable_fields_names.pop(self.model, None)
 
     def __exit__(self, exc_type, exc_value, traceback):
         setattr(self.model, 'TranslatableMeta', self.old_tmeta)
 
-        if hasattr(self.model, '_cached_translatable_fields'):
-            delattr(self.model, '_cached_translatable_fields')
-        if hasattr(self.model, '_cached_translatable_fields_names'):
-            delattr(self.model, '_cached_translatable_fields_names')
+        _translatable_fields.pop(self.model, None)
+        _translatable_fields_names.pop(self.model, None)
 
 
 class CommandTest(TestCase):
@@ -8,6 +8,17 @@ from sample.models import Timezone, Continent, City
 from sample.utils import create_samples
 
 
+class NamedContinent(Continent):
+    """A proxy of `Continent` which only translates the name."""
+
+    class Meta:
+        app_label = 'sample'
+        proxy = True
+
+    class TranslatableMeta:
+        fields = ['name']
+
+
 class TranslationTest(TestCase):
     """Tests for `Translation`."""
 
@@ -229,6 +240,22 @@ class TranslatableTest(TestCase):
             ]
         )
 
+    def test_get_translatable_fields_cached(self):
+        self.assertIs(
+            City.get_translatable_fields(),
+            City.get_translatable_fields(),
+        )
+
+    def test_get_translatable_fields_cached_per_class(self):
+        Continent.get_translatable_fields()
+
+        self.assertListEqual(
+            NamedContinent.get_translatable_fields(),
+            [
+                NamedContinent._meta.get_field('name'),
+            ]
+        )
+
     def test_get_translatable_fields_names_automatic(self):
         self.assertListEqual(
             City._get_translatable_fields_names(),
@@ -24,6 +24,16 @@ class FetchTranslationsQueryGetterTest(TestCase):
             ]
         )
 
+    def test_getter_cached(self):
+        self.assertIs(
+            _fetch_translations_query_getter(Continent, 'de'),
+            _fetch_translations_query_getter(Continent, 'de'),
+        )
+        self.assertIs(
+            _fetch_translations_query_getter(Continent, ['en', 'de']),
+            _fetch_translations_query_getter(Continent, ('en', 'de')),
+        )
+
     def test_lookup_nrel_yfield_ytrans_nsupp_strlang(self):
         getter = _fetch_translations_query_getter(Continent, 'de')
 
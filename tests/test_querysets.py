@@ -2,7 +2,7 @@ from django.test import TestCase, override_settings
 from django.db.models import Q
 from django.utils.translation import override
 
-from sample.models import Continent
+from sample.models import Timezone, Continent, City
 from sample.utils import create_samples
 
 
@@ -44,6 +44,21 @@ class TranslatableQuerySetTest(TestCase):
         )
         self.assertEqual(continents._trans_cache, False)
 
+    def test_translate_mode(self):
+        continents = Continent.objects.all()
+
+        self.assertIs(continents._translate_mode, False)
+        self.assertIs(continents.translate('de')._translate_mode, True)
+        self.assertIs(
+            continents.translate('de').translate('en')._translate_mode,
+            False
+        )
+
+        continents._trans_lang = 'de'
+
+        self.assertIs(continents._translate_mode, True)
+        self.assertIs(continents._chain()._translate_mode, True)
+
     def test_fetch_all_normal_mode(self):
         create_samples(
             continent_names=['europe'],
@@ -56,6 +71,88 @@ class TranslatableQuerySetTest(TestCase):
         self.assertEqual(continents[0].name, 'Europe')
         self.assertEqual(continents[0].denonym, 'European')
 
+    def test_fetch_all_empty(self):
+        continents = Continent.objects.translate(
+            'de').translate_related('countries')
+
+        with self.assertNumQueries(1):
+            self.assertListEqual(list(continents), [])
+
+        self.assertEqual(continents._trans_cache, True)
+
+    def test_fetch_all_no_translatable_fields(self):
+        Timezone.objects.create(name='Europe/Berlin')
+
+        timezones = Timezone.objects.translate('de')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(list(timezones)[0].name, 'Europe/Berlin')
+
+        self.assertEqual(timezones._trans_cache, True)
+
+    def test_fetch_all_relation_prefetched_together(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate(
+            'de').translate_related('countries')
+
+        # continents, countries and translations
+        with self.assertNumQueries(3):
+            europe = [x for x in continents if x.code == 'EU'][0]
+            germany = europe.countries.all()[0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(germany.name, 'Deutschland')
+
+    def test_fetch_all_nested_relation_prefetched_together(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            continent_fields=['name', 'denonym'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate(
+            'de').translate_related('countries', 'countries__cities')
+
+        # continents, countries, cities and translations
+        with self.assertNumQueries(4):
+            europe = [x for x in continents if x.code == 'EU'][0]
+            germany = europe.countries.all()[0]
+            cologne = germany.cities.all()[0]
+
+        self.assertEqual(europe.name, 'Europa')
+        self.assertEqual(germany.name, 'Deutschland')
+        self.assertEqual(cologne.name, 'Köln')
+
+    def test_fetch_all_forward_relation_prefetched_together(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+            country_fields=['name', 'denonym'],
+            city_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        cities = City.objects.translate('de').translate_related('country')
+
+        # cities, countries and translations
+        with self.assertNumQueries(3):
+            cologne = [x for x in cities if x.name == 'Köln'][0]
+            germany = cologne.country
+
+        self.assertEqual(germany.name, 'Deutschland')
+
     @override(language='de', deactivate=True)
     def test_fetch_all_get_level_0_relation_no_lang(self):
         create_samples(
@@ -2252,6 +2349,48 @@ class TranslatableQuerySetTest(TestCase):
         self.assertEqual(seoul.name, 'Seoul')
         self.assertEqual(seoul.denonym, 'Seouler')
 
+    def test_configure(self):
+        continents = Continent.objects.configure(
+            lang='de',
+            related=['countries', 'countries__cities'],
+            probe=['en', 'de'],
+        )
+
+        self.assertEqual(continents._trans_lang, 'de')
+        self.assertTupleEqual(
+            continents._trans_rels,
+            ('countries', 'countries__cities',)
+        )
+        self.assertEqual(continents._trans_prob, ['en', 'de'])
+
+    def test_configure_partial(self):
+        continents = Continent.objects.translate(
+            'de').probe('de').configure(related=['countries'])
+
+        self.assertEqual(continents._trans_lang, 'de')
+        self.assertTupleEqual(continents._trans_rels, ('countries',))
+        self.assertEqual(continents._trans_prob, 'de')
+
+    def test_configure_related_str(self):
+        continents = Continent.objects.configure(related='countries')
+
+        self.assertTupleEqual(continents._trans_rels, ('countries',))
+
+    def test_configure_related_none(self):
+        continents = Continent.objects.translate_related(
+            'countries').configure(related=None)
+
+        self.assertTupleEqual(continents._trans_rels, ())
+
+    def test_configure_invalid_lang(self):
+        with self.assertRaises(ValueError) as error:
+            Continent.objects.configure(lang='xx')
+
+        self.assertEqual(
+            error.exception.args[0],
+            '`xx` is not a supported language.'
+        )
+
     def test_translate(self):
         continents = Continent.objects.translate('de')
 
@@ -2306,6 +2445,73 @@ class TranslatableQuerySetTest(TestCase):
             '`xx` is not a supported language.'
         )
 
+    def test_fetch_all_values(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').values(
+            'code', 'name').order_by('code')
+
+        self.assertListEqual(
+            list(continents),
+            [
+                {'code': 'AS', 'name': 'Asien'},
+                {'code': 'EU', 'name': 'Europa'},
+            ]
+        )
+
+    def test_fetch_all_values_list(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').values_list(
+            'name', 'pk', 'denonym').order_by('code')
+
+        self.assertListEqual(
+            list(continents),
+            [
+                ('Asien', 'AS', 'Asiatisch'),
+                ('Europa', 'EU', 'Europäisch'),
+            ]
+        )
+
+    def test_fetch_all_values_list_flat(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').values_list(
+            'code', flat=True).order_by('code')
+
+        with self.assertRaises(TypeError):
+            list(continents)
+
+    def test_fetch_all_values_no_pk(self):
+        create_samples(
+            continent_names=['europe'],
+            continent_fields=['name', 'denonym'],
+            langs=['de']
+        )
+
+        continents = Continent.objects.translate('de').values('name')
+
+        with self.assertRaises(TypeError) as error:
+            list(continents)
+
+        self.assertEqual(
+            error.exception.args[0],
+            'Translating `values` and `values_list` requires ' +
+            'the primary key to be included in the fields.'
+        )
+
     def test_fetch_latest(self):
         create_samples(
             continent_names=['europe'],
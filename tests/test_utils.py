@@ -1,10 +1,13 @@
 from django.test import TestCase
 from django.core.exceptions import FieldDoesNotExist
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.auth.models import User, Group
+from django.contrib.admin.models import LogEntry, ADDITION
 
 from translations.utils import _get_reverse_relation, _get_dissected_lookup, \
-    _get_relations_hierarchy, _get_entity_details, \
-    _get_purview, _get_translations
+    _get_relations_hierarchy, _get_entity_details, _get_relation_field, \
+    _get_hierarchy_models, _prefetch_relation, _get_purview, \
+    _get_translations
 
 from sample.models import Continent, Country, City
 from sample.utils import create_samples
@@ -581,6 +584,162 @@ class GetEntityDetailsTest(TestCase):
         )
 
 
+class GetRelationFieldTest(TestCase):
+    """Tests for `_get_relation_field`."""
+
+    def test_forward_relation(self):
+        self.assertIs(
+            _get_relation_field(City, 'country'),
+            City._meta.get_field('country')
+        )
+
+    def test_reverse_relation(self):
+        self.assertIs(
+            _get_relation_field(Continent, 'countries'),
+            Continent._meta.get_field('countries')
+        )
+
+    def test_reverse_relation_no_related_name(self):
+        self.assertIs(
+            _get_relation_field(Group, 'user_set'),
+            Group._meta.get_field('user')
+        )
+
+    def test_reverse_relation_query_name(self):
+        self.assertIsNone(_get_relation_field(Group, 'user'))
+
+    def test_not_relation(self):
+        self.assertIsNone(_get_relation_field(Continent, 'name'))
+
+    def test_invalid_relation(self):
+        self.assertIsNone(_get_relation_field(Continent, 'wrong'))
+
+
+class GetHierarchyModelsTest(TestCase):
+    """Tests for `_get_hierarchy_models`."""
+
+    def test_level_0_relation(self):
+        hierarchy = _get_relations_hierarchy()
+
+        self.assertListEqual(
+            _get_hierarchy_models(Continent, hierarchy),
+            [Continent]
+        )
+
+    def test_level_1_2_relation(self):
+        hierarchy = _get_relations_hierarchy('countries', 'countries__cities')
+
+        self.assertListEqual(
+            _get_hierarchy_models(Continent, hierarchy),
+            [Continent, Country, City]
+        )
+
+    def test_invalid_relation(self):
+        hierarchy = _get_relations_hierarchy('wrong')
+
+        self.assertListEqual(
+            _get_hierarchy_models(Continent, hierarchy),
+            [Continent]
+        )
+
+
+class PrefetchRelationTest(TestCase):
+    """Tests for `_prefetch_relation`."""
+
+    def test_forward_relation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+            city_names=['cologne', 'seoul'],
+        )
+
+        cities = list(City.objects.all())
+
+        with self.assertNumQueries(1):
+            self.assertIs(_prefetch_relation(City, cities, 'country'), True)
+
+        with self.assertNumQueries(0):
+            self.assertSetEqual(
+                {city.country.name for city in cities},
+                {'Germany', 'South Korea'}
+            )
+
+    def test_reverse_relation(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            country_names=['germany', 'south korea'],
+        )
+
+        continents = list(Continent.objects.all())
+
+        with self.assertNumQueries(1):
+            _prefetch_relation(Continent, continents, 'countries')
+
+        with self.assertNumQueries(0):
+            self.assertSetEqual(
+                {
+                    country.name for continent in continents
+                    for country in continent.countries.all()
+                },
+                {'Germany', 'South Korea'}
+            )
+
+    def test_reverse_relation_no_related_name(self):
+        users = [
+            User.objects.create(username='behzad'),
+            User.objects.create(username='max'),
+        ]
+        for user in users:
+            LogEntry.objects.create(
+                user=user,
+                object_repr=user.username,
+                action_flag=ADDITION,
+            )
+
+        with self.assertNumQueries(1):
+            _prefetch_relation(User, users, 'logentry_set')
+
+        with self.assertNumQueries(0):
+            self.assertListEqual(
+                [user.logentry_set.all()[0].object_repr for user in users],
+                ['behzad', 'max']
+            )
+
+    def test_reverse_many_to_many_no_related_name(self):
+        groups = [
+            Group.objects.create(name='admins'),
+            Group.objects.create(name='editors'),
+        ]
+        for group in groups:
+            User.objects.create(username=group.name).groups.add(group)
+
+        with self.assertNumQueries(1):
+            _prefetch_relation(Group, groups, 'user_set')
+
+        # already prefetched
+        with self.assertNumQueries(0):
+            _prefetch_relation(Group, groups, 'user_set')
+            self.assertListEqual(
+                [group.user_set.all()[0].username for group in groups],
+                ['admins', 'editors']
+            )
+
+    def test_reverse_relation_query_name(self):
+        groups = [Group.objects.create(name='admins')]
+
+        with self.assertNumQueries(0):
+            self.assertIs(_prefetch_relation(Group, groups, 'user'), False)
+
+    def test_invalid_relation(self):
+        continents = [Continent.objects.create(name='Europe', code='EU')]
+
+        with self.assertNumQueries(0):
+            self.assertIs(
+                _prefetch_relation(Continent, continents, 'wrong'),
+                False
+            )
+
+
 class GetPurviewTest(TestCase):
     """Tests for `_get_purview`."""
 
@@ -746,6 +905,29 @@ class GetPurviewTest(TestCase):
             }
         )
 
+    def test_queryset_level_0_relation_query(self):
+        create_samples(
+            continent_names=['europe', 'asia'],
+            continent_fields=['name', 'denonym'],
+            langs=['de', 'tr']
+        )
+
+        continents = Continent.objects.all()
+
+        hierarchy = _get_relations_hierarchy()
+
+        ct_continent = ContentType.objects.get_for_model(Continent)
+
+        mapping, query = _get_purview(continents, hierarchy)
+
+        self.assertDictEqual(
+            dict(query.children),
+            {
+                'content_type__id': ct_continent.id,
+                'object_id__in': [str(x.pk) for x in continents],
+            }
+        )
+
     def test_queryset_level_1_relation(self):
         create_samples(
             continent_names=['europe', 'asia'],
@@ -61,15 +61,32 @@ class Context:
         """
         lang = _get_translate_language(lang)
         if lang != _get_default_language():
-            _translations = _get_translations(self.query, lang)
-            for translation in _translations:
-                ct_id = translation.content_type.id
-                obj_id = translation.object_id
-                field = translation.field
-                text = translation.text
+            # only the columns needed to apply the translations are fetched,
+            # which saves instantiating a `Translation` for every row
+            _translations = _get_translations(self.query, lang).values_list(
+                'content_type', 'object_id', 'field', 'text',
+            )
+
+            # look up the translatable fields once per model rather than
+            # once per translation, proxies may share a content type but
+            # not the fields
+            fields = {}
+
+            # gather all the changes first so that the objects are not left
+            # half translated if fetching the translations fails midway
+            changes = []
+            for (ct_id, obj_id, field, text) in _translations:
                 obj = self.mapping[ct_id][obj_id]
-                if field in type(obj)._get_translatable_fields_names():
-                    setattr(obj, field, text)
+                model = type(obj)
+                if model not in fields:
+                    fields[model] = frozenset(
+                        model._get_translatable_fields_names()
+                    )
+                if field in fields[model]:
+                    changes.append((obj, field, text))
+
+            for (obj, field, text) in changes:
+                setattr(obj, field, text)
         else:
             self.reset()
 
@@ -79,15 +96,27 @@ class Context:
         """
         lang = _get_translate_language(lang)
         if lang != _get_default_language():
-            query = models.Q()
+            objects = {}
             _translations = []
             for address, text in self._get_changed_fields():
-                query |= models.Q(**address)
+                objects.setdefault(
+                    (address['content_type_id'], address['field']),
+                    [],
+                ).append(address['object_id'])
                 _translations.append(
                     translations.models.Translation(
                         language=lang, text=text, **address
                     )
                 )
+
+            # one condition per content type and field, not per object
+            query = models.Q()
+            for ((ct_id, field), obj_ids) in objects.items():
+                query |= models.Q(
+                    content_type_id=ct_id,
+                    field=field,
+                    object_id__in=obj_ids,
+                )
             _get_translations(query, lang).delete()
             translations.models.Translation.objects.bulk_create(_translations)
 
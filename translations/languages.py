@@ -18,29 +18,32 @@ _translation_choices = {}
 
 def _get_supported_language(lang):
     """Return the `supported language` code of a custom language code."""
-    if lang not in _supported_code:
-        code = lang.split('-')[0]
-
-        lang_exists = False
-        code_exists = False
-
-        # break when the lang is found but not when the code is found
-        # cause the code might come before lang and we may miss an accent
-        for choice in settings.LANGUAGES:
-            if lang == choice[0]:
-                lang_exists = True
-                break
-            if code == choice[0]:
-                code_exists = True
-
-        if lang_exists:
-            _supported_code[lang] = lang
-        elif code_exists:
-            _supported_code[lang] = code
-        else:
-            raise ValueError(
-                '`{}` is not a supported language.'.format(lang)
-            )
+    supported = _supported_code.get(lang)
+    if supported is not None:
+        return supported
+
+    code = lang.split('-')[0]
+
+    lang_exists = False
+    code_exists = False
+
+    # break when the lang is found but not when the code is found
+    # cause the code might come before lang and we may miss an accent
+    for choice in settings.LANGUAGES:
+        if lang == choice[0]:
+            lang_exists = True
+            break
+        if code == choice[0]:
+            code_exists = True
+
+    if lang_exists:
+        _supported_code[lang] = lang
+    elif code_exists:
+        _supported_code[lang] = code
+    else:
+        raise ValueError(
+            '`{}` is not a supported language.'.format(lang)
+        )
     return _supported_code[lang]
 
 
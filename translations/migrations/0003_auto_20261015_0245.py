@@ -0,0 +1,17 @@
+# Generated by Django 3.1.14 on 2026-10-15 02:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('translations', '0002_auto_20180920_1245'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='translation',
+            index=models.Index(fields=['content_type', 'language', 'object_id'], name='translations_ct_lang_obj_idx'),
+        ),
+    ]
@@ -13,6 +13,10 @@ from translations.querysets import TranslatableQuerySet
 __docformat__ = 'restructuredtext'
 
 
+_translatable_fields = {}
+_translatable_fields_names = {}
+
+
 class Translation(models.Model):
     """The model which represents the translations."""
 
@@ -56,6 +60,12 @@ class Translation(models.Model):
 
     class Meta:
         unique_together = ('content_type', 'object_id', 'field', 'language',)
+        indexes = [
+            models.Index(
+                fields=['content_type', 'language', 'object_id'],
+                name='translations_ct_lang_obj_idx',
+            ),
+        ]
         verbose_name = _('translation')
         verbose_name_plural = _('translations')
 
@@ -84,7 +94,7 @@ class Translatable(models.Model):
     @classmethod
     def get_translatable_fields(cls):
         """Return the model’s translatable fields."""
-        if not hasattr(cls, '_cached_translatable_fields'):
+        if cls not in _translatable_fields:
             if cls.TranslatableMeta.fields is None:
                 fields = []
                 for field in cls._meta.get_fields():
@@ -103,17 +113,17 @@ class Translatable(models.Model):
                     cls._meta.get_field(field_name)
                     for field_name in cls.TranslatableMeta.fields
                 ]
-            cls._cached_translatable_fields = fields
-        return cls._cached_translatable_fields
+            _translatable_fields[cls] = fields
+        return _translatable_fields[cls]
 
     @classmethod
     def _get_translatable_fields_names(cls):
         """Return the names of the model's translatable fields."""
-        if not hasattr(cls, '_cached_translatable_fields_names'):
-            cls._cached_translatable_fields_names = [
+        if cls not in _translatable_fields_names:
+            _translatable_fields_names[cls] = [
                 field.name for field in cls.get_translatable_fields()
             ]
-        return cls._cached_translatable_fields_names
+        return _translatable_fields_names[cls]
 
     @classmethod
     def _get_translatable_fields_choices(cls):
@@ -12,6 +12,9 @@ from translations.utils import _get_dissected_lookup
 __docformat__ = 'restructuredtext'
 
 
+_translations_query_getters = {}
+
+
 def _fetch_translations_query_getter(model, lang):
     """
     Return the translations query getter specialized for a model and some
@@ -19,6 +22,24 @@ def _fetch_translations_query_getter(model, lang):
     """
     default = _get_default_language()
 
+    key = (
+        model,
+        tuple(lang) if isinstance(lang, (list, tuple)) else lang,
+        default,
+    )
+    if key not in _translations_query_getters:
+        _translations_query_getters[key] = _get_translations_query_getter(
+            *key
+        )
+    return _translations_query_getters[key]
+
+
+def _get_translations_query_getter(model, lang, default):
+    """
+    Build the translations query getter specialized for a model and some
+    language(s).
+    """
+
     def _get_translations_query(*args, **kwargs):
         connector = kwargs.pop('_connector', None)
         negated = kwargs.pop('_negated', False)
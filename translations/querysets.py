@@ -1,38 +1,83 @@
 """This module contains the querysets for the Translations app."""
 
-from django.db.models import query
+from collections import namedtuple
+
+from django.db.models import query, Q
+from django.contrib.contenttypes.models import ContentType
 
 from translations.languages import _get_default_language, \
     _get_translate_language, _get_probe_language
 from translations.query import _fetch_translations_query_getter
 from translations.context import Context
+from translations.utils import _get_translations
 
 
 __docformat__ = 'restructuredtext'
 
 
+_TransState = namedtuple(
+    '_TransState',
+    ['lang', 'prob', 'rels', 'cache', 'mode'],
+)
+
+_UNSET = object()
+
+
+def _get_trans_state_property(name):
+    """Return a property which proxies a field of the translation state."""
+
+    def fget(self):
+        return getattr(self._trans_state, name)
+
+    def fset(self, value):
+        self._trans_state = self._trans_state._replace(**{name: value})
+
+    return property(fget, fset)
+
+
 class TranslatableQuerySet(query.QuerySet):
     """A queryset which provides custom translation functionalities."""
 
+    _trans_prob = _get_trans_state_property('prob')
+    _trans_rels = _get_trans_state_property('rels')
+    _trans_cache = _get_trans_state_property('cache')
+
     def __init__(self, *args, **kwargs):
         """Initialize a `TranslatableQuerySet` with `QuerySet` arguments."""
         super(TranslatableQuerySet, self).__init__(*args, **kwargs)
-        self._trans_lang = _get_default_language()
-        self._trans_prob = _get_default_language()
-        self._trans_rels = ()
-        self._trans_cache = False
+        default = _get_default_language()
+        self._trans_state = _TransState(
+            lang=default,
+            prob=default,
+            rels=(),
+            cache=False,
+            mode=False,
+        )
+
+    @property
+    def _trans_lang(self):
+        """Return the translate language of the `TranslatableQuerySet`."""
+        return self._trans_state.lang
+
+    @_trans_lang.setter
+    def _trans_lang(self, value):
+        """Set the translate language and whether translating is needed."""
+        self._trans_state = self._trans_state._replace(
+            lang=value,
+            mode=value != _get_default_language(),
+        )
+
+    @property
+    def _translate_mode(self):
+        """Return whether the `TranslatableQuerySet` must be translated."""
+        return self._trans_state.mode
 
     def _chain(self, **kwargs):
         """Return a copy of the current `TranslatableQuerySet`."""
         clone = super(TranslatableQuerySet, self)._chain(**kwargs)
 
-        # default values for all
-        clone._trans_lang = getattr(self, '_trans_lang')
-        clone._trans_prob = getattr(self, '_trans_prob')
-        clone._trans_rels = getattr(self, '_trans_rels')
-
-        # reset cache on chaining
-        clone._trans_cache = False
+        # copy the state in one go and reset cache on chaining
+        clone._trans_state = self._trans_state._replace(cache=False)
 
         return clone
 
@@ -40,39 +85,145 @@ class TranslatableQuerySet(query.QuerySet):
         """Evaluate the `TranslatableQuerySet`."""
         super(TranslatableQuerySet, self)._fetch_all()
 
-        if self._trans_lang == _get_default_language():
+        if not self._trans_state.mode:
             return
 
-        if self._iterable_class is not query.ModelIterable:
+        if self._iterable_class not in (
+            query.ModelIterable,
+            query.ValuesIterable,
+            query.ValuesListIterable,
+        ):
             raise TypeError(
                 'Translations does not support custom iteration (yet). ' +
-                'e.g. values, values_list, etc. ' +
-                'If necessary you can `decipher` and then do it.'
+                'e.g. values_list(flat=True), values_list(named=True), ' +
+                'etc. If necessary you can translate in the default ' +
+                'language and then do it.'
             )
 
+        if not self._result_cache or not (
+            self._trans_rels or self.model._get_translatable_fields_names()
+        ):
+            self._trans_cache = True
+            return
+
         if not self._trans_cache:
-            with Context(self._result_cache, *self._trans_rels) \
-                    as context:
-                context.read(self._trans_lang)
+            if self._iterable_class is query.ModelIterable:
+                with Context(self._result_cache, *self._trans_rels) \
+                        as context:
+                    context.read(self._trans_lang)
+            else:
+                self._read_values()
             self._trans_cache = True
 
-    def translate(self, lang=None):
-        """Translate the `TranslatableQuerySet` in a language."""
+    def _get_values_names(self):
+        """Return the names of the columns in the `values_list` rows."""
+        if self._fields and (
+            self.query.extra_select or self.query.annotation_select
+        ):
+            return list(self._fields)
+        return [
+            *self.query.extra_select,
+            *self.query.values_select,
+            *self.query.annotation_select,
+        ]
+
+    def _read_values(self):
+        r"""
+        Read the translations of the `TranslatableQuerySet`\ 's `values` or
+        `values_list` rows in the translate language.
+        """
+        is_dict = self._iterable_class is query.ValuesIterable
+        if is_dict:
+            names = list(self._result_cache[0])
+        else:
+            names = self._get_values_names()
+
+        fields = [
+            name for name in names
+            if name in self.model._get_translatable_fields_names()
+        ]
+        if not fields:
+            return
+
+        pk = self.model._meta.pk
+        for pk_name in ('pk', pk.name, pk.attname):
+            if pk_name in names:
+                break
+        else:
+            raise TypeError(
+                'Translating `values` and `values_list` requires ' +
+                'the primary key to be included in the fields.'
+            )
+
+        pk_index = pk_name if is_dict else names.index(pk_name)
+        ct_id = ContentType.objects.get_for_model(self.model).id
+        rows = _get_translations(
+            Q(
+                content_type__id=ct_id,
+                object_id__in=[
+                    str(row[pk_index]) for row in self._result_cache
+                ],
+            ),
+            self._trans_lang,
+        ).filter(
+            field__in=fields,
+        ).values_list(
+            'object_id', 'field', 'text',
+        )
+
+        # group the texts by object so each row needs a single lookup
+        _translations = {}
+        for (obj_id, field, text) in rows:
+            _translations.setdefault(obj_id, {})[field] = text
+        if not _translations:
+            return
+
+        if is_dict:
+            for row in self._result_cache:
+                texts = _translations.get(str(row[pk_index]))
+                if texts:
+                    row.update(texts)
+        else:
+            indexes = {field: names.index(field) for field in fields}
+            for (i, row) in enumerate(self._result_cache):
+                texts = _translations.get(str(row[pk_index]))
+                if texts:
+                    values = list(row)
+                    for (field, text) in texts.items():
+                        values[indexes[field]] = text
+                    self._result_cache[i] = tuple(values)
+
+    def configure(self, *, lang=_UNSET, related=_UNSET, probe=_UNSET):
+        """Configure the translation of the `TranslatableQuerySet` at once."""
+        changes = {}
+        if lang is not _UNSET:
+            changes['lang'] = _get_translate_language(lang)
+            changes['mode'] = changes['lang'] != _get_default_language()
+        if related is not _UNSET:
+            if related is None:
+                changes['rels'] = ()
+            elif isinstance(related, str):
+                changes['rels'] = (related,)
+            else:
+                changes['rels'] = tuple(related)
+        if probe is not _UNSET:
+            changes['prob'] = _get_probe_language(probe)
+
         clone = self.all()
-        clone._trans_lang = _get_translate_language(lang)
+        clone._trans_state = clone._trans_state._replace(**changes)
         return clone
 
+    def translate(self, lang=None):
+        """Translate the `TranslatableQuerySet` in a language."""
+        return self.configure(lang=lang)
+
     def translate_related(self, *fields):
         """Translate some relations of the `TranslatableQuerySet`."""
-        clone = self.all()
-        clone._trans_rels = () if fields == (None,) else fields
-        return clone
+        return self.configure(related=None if fields == (None,) else fields)
 
     def probe(self, lang=None):
         """Probe the `TranslatableQuerySet` in some language(s)."""
-        clone = self.all()
-        clone._trans_prob = _get_probe_language(lang)
-        return clone
+        return self.configure(probe=lang)
 
     def filter(self, *args, **kwargs):
         """Filter the `TranslatableQuerySet`."""
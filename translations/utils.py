@@ -139,64 +139,146 @@ def _get_entity_details(entity):
     return (iterable, model)
 
 
-def _get_purview(entity, hierarchy):
-    """Return the purview of an entity and a relations hierarchy of it."""
-    mapping = {}
-    query = models.Q()
+def _get_relation_field(model, relation):
+    """Return the field of a model's relation accessor."""
+    for field in model._meta.get_fields():
+        if not field.is_relation:
+            continue
+        if field.auto_created and not field.concrete:
+            accessor = field.get_accessor_name()
+        else:
+            accessor = field.name
+        if accessor == relation:
+            return field
+    return None
+
+
+def _get_hierarchy_models(model, hierarchy):
+    """Return the models of a model and a relations hierarchy of it."""
+    hierarchy_models = [model]
+
+    for (relation, detail) in hierarchy.items():
+        field = _get_relation_field(model, relation)
+        if field is not None and field.related_model:
+            hierarchy_models += _get_hierarchy_models(
+                field.related_model,
+                detail['relations'],
+            )
+
+    return hierarchy_models
+
+
+def _prefetch_relation(model, objs, relation):
+    """
+    Prefetch a relation of some objects of a model all at once and return
+    whether the relation was handled.
+    """
+    field = _get_relation_field(model, relation)
+    if field is None:
+        return False
+
+    if field.many_to_many or field.one_to_many:
+        unfetched = []
+        for obj in objs:
+            # the managers know where they cache the prefetched objects,
+            # which is not always under the accessor name
+            cache_name = getattr(
+                getattr(obj, relation),
+                'prefetch_cache_name',
+                relation,
+            )
+            if not (
+                hasattr(obj, '_prefetched_objects_cache') and
+                cache_name in obj._prefetched_objects_cache
+            ):
+                unfetched.append(obj)
+    elif hasattr(field, 'is_cached'):
+        unfetched = [obj for obj in objs if not field.is_cached(obj)]
+    else:
+        return False
 
-    def _fill_entity(entity, hierarchy, included=True):
-        iterable, model = _get_entity_details(entity)
+    if unfetched:
+        prefetch_related_objects(unfetched, relation)
 
-        if model is None:
-            return
+    return True
 
-        content_type_id = ContentType.objects.get_for_model(model).id
 
+def _get_purview(entity, hierarchy):
+    """Return the purview of an entity and a relations hierarchy of it."""
+    mapping = {}
+    content_types = {}
+
+    def _fill_objs(model, objs, hierarchy, included=True):
         if included:
-            instances = mapping.setdefault(content_type_id, {})
+            if model not in content_types:
+                content_types[model] = \
+                    ContentType.objects.get_for_model(model).id
+            instances = mapping.setdefault(content_types[model], {})
             if not issubclass(model, translations.models.Translatable):
                 raise TypeError('`{}` is not Translatable!'.format(model))
+            fields_names = model._get_translatable_fields_names()
 
-        def _fill_obj(obj):
-            if included:
+            for obj in objs:
                 if not hasattr(obj, '_default_translatable_fields'):
                     obj._default_translatable_fields = {
-                        field: getattr(obj, field) for field in
-                        type(obj)._get_translatable_fields_names()
+                        field: getattr(obj, field) for field in fields_names
                     }
                 object_id = str(obj.pk)
                 instances[object_id] = obj
-                nonlocal query
-                query |= models.Q(
-                    content_type__id=content_type_id,
-                    object_id=object_id,
-                )
 
-            if hierarchy:
-                for (relation, detail) in hierarchy.items():
-                    value = getattr(obj, relation, None)
-
-                    if value is not None:
-                        if isinstance(value, models.Manager):
-                            if not (
-                                hasattr(obj, '_prefetched_objects_cache') and
-                                relation in obj._prefetched_objects_cache
-                            ):
-                                prefetch_related_objects([obj], relation)
-                            value = value.all()
-                        _fill_entity(
-                            entity=value,
-                            hierarchy=detail['relations'],
-                            included=detail['included'],
-                        )
+        for (relation, detail) in hierarchy.items():
+            # prefetch the relation of all the objects in this level of the
+            # hierarchy together rather than one object at a time
+            prefetched = _prefetch_relation(model, objs, relation)
+
+            related = {}
+            for obj in objs:
+                value = getattr(obj, relation, None)
+
+                if value is not None:
+                    if isinstance(value, models.Manager):
+                        if not prefetched and not (
+                            hasattr(obj, '_prefetched_objects_cache') and
+                            relation in obj._prefetched_objects_cache
+                        ):
+                            prefetch_related_objects([obj], relation)
+                        value = value.all()
+
+                    iterable, value_model = _get_entity_details(value)
+                    if value_model is not None:
+                        values = related.setdefault(value_model, {})
+                        for value_obj in (value if iterable else [value]):
+                            values[id(value_obj)] = value_obj
+
+            for (value_model, values) in related.items():
+                _fill_objs(
+                    value_model,
+                    list(values.values()),
+                    detail['relations'],
+                    detail['included'],
+                )
 
-        if iterable:
-            for obj in entity:
-                _fill_obj(obj)
-        else:
-            _fill_obj(entity)
+    iterable, model = _get_entity_details(entity)
+    if model is not None:
+        content_types.update({
+            content_type_model: content_type.id
+            for (content_type_model, content_type) in
+            ContentType.objects.get_for_models(
+                *_get_hierarchy_models(model, hierarchy)
+            ).items()
+        })
+        _fill_objs(model, entity if iterable else [entity], hierarchy)
 
-    _fill_entity(entity, hierarchy)
+    # group the objects by their content type so the query has one condition
+    # per content type rather than one per object, the `object_id__in` lists
+    # still grow with the number of objects in the purview
+    query = models.Q()
+    for (content_type_id, instances) in mapping.items():
+        if instances:
+            query |= models.Q(
+                content_type__id=content_type_id,
+                object_id__in=list(instances),
+            )
 
     return mapping, query
 